@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from ingest import DATA_FILE, load_matches
+
+# Default season window (same as the dashboard: last 5 years, 2019-2023)
+DEFAULT_START_YEAR = 2019
+DEFAULT_END_YEAR = 2023
+
+
+def get_dataset_version(path=DATA_FILE):
+    # Changes whenever the CSV file is replaced or edited
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+# Load and preprocess data (same validated ingest as app.py)
+@lru_cache(maxsize=1)
+def load_data(version):
+    df, rejected = load_matches(DATA_FILE)
+
+    # Extract year from date
+    df['year'] = df['date'].dt.year
+
+    return df
+
+
+def select_window(df, query):
+    # Filter to the requested season window
+    start = int(query.get('start', DEFAULT_START_YEAR))
+    end = int(query.get('end', DEFAULT_END_YEAR))
+    return df[df['year'].between(start, end)]
+
+
+def get_limit(query):
+    limit = int(query.get('limit', 10))
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    return limit
+
+
+def team_summary(df, query):
+    team = query['team']
+    team_matches = df[(df['team_1'] == team) | (df['team_2'] == team)]
+    wins = int((team_matches['match_winner'] == team).sum())
+    # Matches without a result are neither wins nor losses
+    decided = int(team_matches['match_winner'].notna().sum())
+    toss_wins = team_matches[team_matches['toss_winner'] == team]
+    return {
+        'team': team,
+        'matches_played': len(team_matches),
+        'wins': wins,
+        'losses': decided - wins,
+        'no_result': len(team_matches) - decided,
+        'toss_wins': len(toss_wins),
+        'toss_decisions': toss_wins['toss_decision'].value_counts().to_dict(),
+    }
+
+
+def head_to_head(df, query):
+    team_1, team_2 = query['team_1'], query['team_2']
+    matches = df[((df['team_1'] == team_1) & (df['team_2'] == team_2)) |
+                 ((df['team_1'] == team_2) & (df['team_2'] == team_1))]
+    return {
+        'team_1': team_1,
+        'team_2': team_2,
+        'matches': len(matches),
+        'wins': matches['match_winner'].value_counts().to_dict(),
+    }
+
+
+def top_players(df, query):
+    limit = get_limit(query)
+    awards = df['player_of_match'].value_counts().head(limit)
+    return [{'player': player, 'awards': int(count)} for player, count in awards.items()]
+
+
+def venue_stats(df, query):
+    limit = get_limit(query)
+    venues = df.assign(toss_winner_won=df['toss_winner'] == df['match_winner']).groupby('venue').agg(
+        matches=('match_id', 'size'),
+        toss_winner_won=('toss_winner_won', 'sum'),
+    ).sort_values('matches', ascending=False).head(limit)
+    return venues.reset_index().to_dict(orient='records')
+
+
+def season_window(df, query):
+    return [
+        {
+            'year': int(year),
+            'matches': len(season),
+            'venues': season['venue'].nunique(),
+            'wins': season['match_winner'].value_counts().to_dict(),
+        }
+        for year, season in df.groupby('year')
+    ]
+
+
+ENDPOINTS = {
+    '/team': team_summary,
+    '/head-to-head': head_to_head,
+    '/top-players': top_players,
+    '/venues': venue_stats,
+    '/seasons': season_window,
+}
+
+
+# Responses (and their ETags) are cached per dataset version, path and query string
+@lru_cache(maxsize=1024)
+def render(version, path, query_items):
+    endpoint = ENDPOINTS.get(path)
+    query = dict(query_items)
+    if endpoint is None:
+        status, result = 404, {'error': f"Unknown endpoint {path}"}
+    else:
+        try:
+            status, result = 200, endpoint(select_window(load_data(version), query), query)
+        except KeyError as e:
+            status, result = 400, {'error': f"Missing query parameter {e}"}
+        except ValueError as e:
+            status, result = 400, {'error': str(e)}
+
+    body = json.dumps(result, default=str).encode()
+    etag = '"' + hashlib.sha1(version.encode() + body).hexdigest() + '"'
+    return status, body, etag
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        query_items = tuple(sorted(parse_qsl(url.query)))
+        version = get_dataset_version()
+        status, body, etag = render(version, url.path, query_items)
+
+        # Let clients revalidate without re-downloading an unchanged response
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep the console quiet under load
+        pass
+
+
+def serve(host="127.0.0.1", port=8502):
+    # ThreadingHTTPServer handles each request on its own worker thread
+    server = ThreadingHTTPServer((host, port), APIRequestHandler)
+    print(f"IPL API listening on http://{host}:{port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    serve()
@@ -1,9 +1,12 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 from datetime import datetime
+from ingest import load_matches
+from player_timelines import build_player_timelines, get_player_timeline, summarize_player_timeline
 
 # Set page configuration
 st.set_page_config(
@@ -38,18 +41,18 @@ st.markdown("""
 st.markdown('<div class="main-header">🏏 IPL Cricket Dashboard</div>', unsafe_allow_html=True)
 st.write("Complete IPL match data analysis with all visualizations from the Jupyter notebook")
 
-# Load and preprocess data (exactly as in your notebook)
+# Load and preprocess data (validated and typed at ingest, see ingest.py)
 @st.cache_data
 def load_data():
-    df = pd.read_csv("ipl_matches_summary.csv")
+    # Dates are parsed strictly, seasons are canonical integers and missing
+    # values stay as nullable NA instead of "Unknown" strings
+    df, rejected = load_matches("ipl_matches_summary.csv")
     
     # Display basic info (as in notebook)
     st.sidebar.subheader("Dataset Info")
     st.sidebar.text(f"Shape: {df.shape}")
     st.sidebar.text(f"Columns: {len(df.columns)}")
-    
-    # Convert date column to datetime format (exactly as in notebook)
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    st.sidebar.text(f"Rejected rows: {len(rejected)}")
     
     # Extract year from date (exactly as in notebook)
     df['year'] = df['date'].dt.year
@@ -57,12 +60,103 @@ def load_data():
     # Filter data for last 5 years (2019-2023) - exactly as in notebook
     df_recent = df[df['year'].between(2019, 2023)]
     
-    # Handle missing values (exactly as in notebook)
-    df_recent.fillna("Unknown", inplace=True)
+    return df, df_recent, rejected
+
+df, df_recent, rejected = load_data()
+
+# Compute the shared aggregate tables once per dataset (instead of per chart)
+@st.cache_data
+def compute_aggregates(data):
+    # Toss winner also won the match (boolean mask, no filtered frame needed)
+    toss_won_match = data['toss_winner'] == data['match_winner']
     
-    return df, df_recent
+    return {
+        'player_awards': data['player_of_match'].value_counts(),
+        'team_wins': data['match_winner'].value_counts(),
+        'season_counts': data['season'].value_counts().sort_index(),
+        'venue_counts': data['venue'].value_counts(),
+        'venue_trends': data.groupby(['season', 'venue']).size().reset_index(name='matches'),
+        'toss_win_match_win': int(toss_won_match.sum()),
+        'total_matches': len(data),
+        'decided_matches': int(data['match_winner'].notna().sum()),
+    }
+
+aggregates = compute_aggregates(df_recent)
+
+# Precompute the Data Explorer dropdown options once per dataset
+@st.cache_data
+def get_filter_options(data):
+    return {
+        'venue': list(data['venue'].unique()),
+        'toss_decision': list(data['toss_decision'].unique()),
+        'match_winner': list(data['match_winner'].dropna().unique()),
+    }
+
+filter_options = get_filter_options(df_recent)
 
-df, df_recent = load_data()
+# Number of rows sent to the browser per page in the Data Explorer
+PAGE_SIZE = 50
+
+# Row positions of the dataset in sort order, once per sort column and direction
+@st.cache_resource(max_entries=16)
+def get_sort_order(data, sort_column, ascending):
+    return data[sort_column].reset_index(drop=True).sort_values(ascending=ascending, kind='stable').index.to_numpy()
+
+# Positions (in sort order) of the rows matching the Data Explorer options. Only
+# this integer array is cached per combination, never a copy of the rows, so a
+# page change is a single iloc lookup into the dataset.
+@st.cache_resource(max_entries=64)
+def get_explorer_positions(data, seasons, venue, toss_decision, result, sort_column, ascending):
+    # Apply filters as a single boolean mask (no intermediate copies)
+    mask = data['season'].isin(seasons) if seasons else pd.Series(True, index=data.index)
+    if venue != "All Venues":
+        mask &= data['venue'] == venue
+    if toss_decision != "All Decisions":
+        mask &= data['toss_decision'] == toss_decision
+    if result != "All Results":
+        mask &= (data['match_winner'] == result).fillna(False)
+    
+    order = get_sort_order(data, sort_column, ascending)
+    return order[mask.to_numpy(dtype=bool)[order]]
+
+# Build the per-player award timelines once per dataset (see player_timelines.py)
+@st.cache_data
+def load_player_timelines(data):
+    return build_player_timelines(data)
+
+player_timelines = load_player_timelines(df_recent)
+
+# Number of bootstrap resamples for the toss impact confidence intervals
+BOOTSTRAP_SAMPLES = 2000
+
+# Groups with fewer decided matches than this get unreliable bootstrap intervals
+MIN_TOSS_GROUP_MATCHES = 10
+
+# Toss winner win rate per group with 95% bootstrap confidence intervals
+@st.cache_data
+def compute_toss_impact(data, group_column, n_resamples=BOOTSTRAP_SAMPLES, seed=42,
+                        min_matches=MIN_TOSS_GROUP_MATCHES):
+    # Matches without a result cannot tell us anything about the toss
+    decided = data[data['match_winner'].notna()]
+    toss_won_match = (decided['toss_winner'] == decided['match_winner']).to_numpy(dtype=bool)
+    rng = np.random.default_rng(seed)
+    
+    rows = []
+    for group, positions in decided.groupby(group_column).indices.items():
+        outcomes = toss_won_match[positions]
+        # Draw every resample for the group at once as an (n_resamples x matches) matrix
+        resamples = outcomes[rng.integers(0, len(outcomes), size=(n_resamples, len(outcomes)))]
+        low, high = np.percentile(resamples.mean(axis=1), [2.5, 97.5])
+        rows.append({
+            group_column: group,
+            'matches': len(outcomes),
+            'win_percentage': outcomes.mean() * 100,
+            'ci_low': low * 100,
+            'ci_high': high * 100,
+            'small_sample': len(outcomes) < min_matches,
+        })
+    
+    return pd.DataFrame(rows)
 
 # Sidebar for filters
 st.sidebar.header("🔧 Filters and Options")
@@ -108,7 +202,7 @@ with tab1:
         st.subheader("Top 10 Players (Player of the Match Awards)")
         st.write("**Exact replica of the notebook chart**")
         
-        top_players = df_recent['player_of_match'].value_counts().head(10)
+        top_players = aggregates['player_awards'].head(10)
         
         fig1, ax1 = plt.subplots(figsize=(10, 6))
         # Using the exact same parameters as your notebook
@@ -128,7 +222,7 @@ with tab1:
         st.subheader("Top Teams by Wins")
         st.write("**Additional chart from notebook analysis**")
         
-        team_wins = df_recent['match_winner'].value_counts().head(10)
+        team_wins = aggregates['team_wins'].head(10)
         
         fig2, ax2 = plt.subplots(figsize=(10, 6))
         # Using the exact same parameters
@@ -147,7 +241,7 @@ with tab1:
     st.subheader("Matches per Season")
     st.write("**Matches distribution across seasons**")
     
-    season_counts = df_recent['season'].value_counts().sort_index()
+    season_counts = aggregates['season_counts']
     
     fig3, ax3 = plt.subplots(figsize=(12, 6))
     season_counts.plot(kind='line', marker='o', ax=ax3, color='blue', linewidth=2, markersize=8)
@@ -173,7 +267,7 @@ with tab2:
             
             # Calculate metrics
             matches_played = len(team_matches)
-            wins = len(team_matches[team_matches['match_winner'] == selected_team])
+            wins = int((team_matches['match_winner'] == selected_team).sum())
             losses = matches_played - wins
             win_percentage = (wins / matches_played) * 100 if matches_played > 0 else 0
             
@@ -225,15 +319,14 @@ with tab3:
         st.subheader("Player of Match Awards Trend")
         
         # Prepare data for top players across seasons
-        top_players_list = df_recent['player_of_match'].value_counts().head(5).index
+        top_players_list = aggregates['player_awards'].head(5).index
         
         player_trend_data = []
         for player in top_players_list:
-            if player != "Unknown":
-                player_data = df_recent[df_recent['player_of_match'] == player]
-                awards_by_season = player_data['season'].value_counts().sort_index()
-                for season, count in awards_by_season.items():
-                    player_trend_data.append({'Player': player, 'Season': season, 'Awards': count})
+            player_data = get_player_timeline(player_timelines, player)
+            awards_by_season = player_data['season'].value_counts().sort_index()
+            for season, count in awards_by_season.items():
+                player_trend_data.append({'Player': player, 'Season': season, 'Awards': count})
         
         if player_trend_data:
             player_trend_df = pd.DataFrame(player_trend_data)
@@ -246,16 +339,28 @@ with tab3:
         # Player search functionality
         st.subheader("Player Performance Search")
         
-        all_players = df_recent['player_of_match'].unique()
+        all_players = df_recent['player_of_match'].dropna().unique()
         selected_player = st.selectbox("Select a Player", 
-                                     ["Select a player"] + sorted([p for p in all_players if p != "Unknown"]))
+                                     ["Select a player"] + sorted(all_players))
         
         if selected_player != "Select a player":
-            player_stats = df_recent[df_recent['player_of_match'] == selected_player]
+            player_stats = get_player_timeline(player_timelines, selected_player)
             awards_count = len(player_stats)
+            player_summary = summarize_player_timeline(player_stats)
             
             st.write(f"**{selected_player}**")
             st.metric("Player of Match Awards", awards_count)
+            st.metric("Awards in Winning Cause", player_summary['awards_in_wins'])
+            st.metric("Awards in Losing Cause", player_summary['awards_in_losses'])
+            st.metric("Awards Not Counted (team unknown or no result)", player_summary['awards_unresolved'])
+            st.metric("Longest Gap Between Awards (days)", player_summary['longest_gap_days'])
+            
+            with st.expander("Awards per team stint"):
+                st.dataframe(player_summary['stints'])
+            
+            with st.expander("Season rank by awards"):
+                season_ranks = player_timelines['season_ranks']
+                st.dataframe(season_ranks[season_ranks['player_of_match'] == selected_player][['season', 'awards', 'rank']])
             
             # Awards by season
             awards_by_season = player_stats['season'].value_counts().sort_index()
@@ -276,8 +381,8 @@ with tab4:
         # Venue popularity by season
         st.subheader("Venue Usage Trend")
         
-        venue_trends = df_recent.groupby(['season', 'venue']).size().reset_index(name='matches')
-        top_venues = df_recent['venue'].value_counts().head(5).index
+        venue_trends = aggregates['venue_trends']
+        top_venues = aggregates['venue_counts'].head(5).index
         
         fig = px.line(venue_trends[venue_trends['venue'].isin(top_venues)], 
                      x='season', y='matches', color='venue',
@@ -289,10 +394,11 @@ with tab4:
         # Toss impact analysis
         st.subheader("Toss Impact on Match Results")
         
-        # Calculate toss winner match winner correlation
-        toss_win_match_win = len(df_recent[df_recent['toss_winner'] == df_recent['match_winner']])
-        total_matches = len(df_recent)
-        toss_win_match_lose = total_matches - toss_win_match_win
+        # Calculate toss winner match winner correlation (matches with a result only,
+        # same as the breakdown below)
+        toss_win_match_win = aggregates['toss_win_match_win']
+        decided_matches = aggregates['decided_matches']
+        toss_win_match_lose = decided_matches - toss_win_match_win
         
         labels = ['Toss Winner Won', 'Toss Winner Lost']
         values = [toss_win_match_win, toss_win_match_lose]
@@ -303,8 +409,39 @@ with tab4:
         ax.set_title('Toss Winner vs Match Winner')
         st.pyplot(fig)
         
-        win_percentage = (toss_win_match_win / total_matches) * 100
+        win_percentage = (toss_win_match_win / decided_matches) * 100 if decided_matches > 0 else 0
         st.metric("Toss Winner Win Percentage", f"{win_percentage:.1f}%")
+        st.metric("Matches with No Result (excluded)", aggregates['total_matches'] - decided_matches)
+        
+        # Toss impact broken down by group, with bootstrap confidence intervals
+        toss_groups = {"Season": "season", "Venue": "venue", "Toss Winner": "toss_winner", "Toss Decision": "toss_decision"}
+        toss_group_label = st.selectbox("Break down toss impact by", list(toss_groups))
+        toss_group = toss_groups[toss_group_label]
+        
+        show_small_groups = st.checkbox(f"Show groups with fewer than {MIN_TOSS_GROUP_MATCHES} matches", value=False)
+        
+        toss_impact = compute_toss_impact(df_recent, toss_group)
+        if not show_small_groups:
+            toss_impact = toss_impact[~toss_impact['small_sample']]
+        
+        # Small groups are greyed out: their intervals are too wide (or degenerate) to trust
+        chart_data = toss_impact.assign(
+            sample=np.where(toss_impact['small_sample'], f"Fewer than {MIN_TOSS_GROUP_MATCHES} matches", "Enough matches"),
+            error_high=toss_impact['ci_high'] - toss_impact['win_percentage'],
+            error_low=toss_impact['win_percentage'] - toss_impact['ci_low'],
+        )
+        fig = px.bar(chart_data, x=toss_group, y='win_percentage', color='sample',
+                     error_y='error_high', error_y_minus='error_low',
+                     hover_data=['matches'],
+                     color_discrete_map={"Enough matches": '#1f77b4',
+                                         f"Fewer than {MIN_TOSS_GROUP_MATCHES} matches": 'lightgray'},
+                     title=f'Toss Winner Win Percentage by {toss_group_label} (95% CI)',
+                     labels={toss_group: toss_group_label, 'win_percentage': 'Win Percentage', 'sample': 'Sample Size'})
+        fig.add_hline(y=50, line_dash='dash', line_color='gray')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        with st.expander("Show data used for this chart"):
+            st.dataframe(toss_impact)
 
 with tab5:
     st.subheader("Data Exploration")
@@ -320,24 +457,35 @@ with tab5:
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            venue_filter = st.selectbox("Filter by Venue", ["All Venues"] + list(df_recent['venue'].unique()))
+            venue_filter = st.selectbox("Filter by Venue", ["All Venues"] + filter_options['venue'])
         with col2:
             toss_decision_filter = st.selectbox("Filter by Toss Decision", 
-                                              ["All Decisions"] + list(df_recent['toss_decision'].unique()))
+                                              ["All Decisions"] + filter_options['toss_decision'])
         with col3:
             result_filter = st.selectbox("Filter by Result", 
-                                       ["All Results"] + list(df_recent['match_winner'].unique()))
-        
-        # Apply filters
-        filtered_table = filtered_df.copy()
-        if venue_filter != "All Venues":
-            filtered_table = filtered_table[filtered_table['venue'] == venue_filter]
-        if toss_decision_filter != "All Decisions":
-            filtered_table = filtered_table[filtered_table['toss_decision'] == toss_decision_filter]
-        if result_filter != "All Results":
-            filtered_table = filtered_table[filtered_table['match_winner'] == result_filter]
-        
-        st.dataframe(filtered_table, height=400)
+                                       ["All Results"] + filter_options['match_winner'])
+        
+        # Sort on the server before slicing out the visible page
+        sort_col, order_col, page_col = st.columns(3)
+        with sort_col:
+            sort_column = st.selectbox("Sort by", list(df_recent.columns))
+        with order_col:
+            sort_ascending = st.checkbox("Ascending", value=True)
+        
+        positions = get_explorer_positions(df_recent, tuple(selected_seasons), venue_filter, toss_decision_filter,
+                                           result_filter, sort_column, sort_ascending)
+        
+        total_rows = len(positions)
+        total_pages = max(1, -(-total_rows // PAGE_SIZE))
+        with page_col:
+            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1)
+        
+        # Only the rows of the current page are sent to the browser
+        start = (page - 1) * PAGE_SIZE
+        page_table = df_recent.iloc[positions[start:start + PAGE_SIZE]]
+        
+        st.dataframe(page_table, height=400)
+        st.caption(f"Showing rows {min(start + 1, total_rows)}-{min(start + PAGE_SIZE, total_rows)} of {total_rows} (page {page} of {total_pages})")
     
     with col2:
         # Quick stats
@@ -346,14 +494,19 @@ with tab5:
         st.metric("Total Matches", len(filtered_df))
         st.metric("Unique Teams", len(all_teams))
         st.metric("Seasons Covered", len(seasons))
-        st.metric("Venues", len(df_recent['venue'].unique()))
+        st.metric("Venues", len(aggregates['venue_counts']))
         
         # Data quality info
         st.subheader("Data Quality")
         missing_data = df.isnull().sum().sum()
         st.metric("Missing Values in Original", missing_data)
         st.metric("Matches with Unknown Winner", 
-                 len(df_recent[df_recent['match_winner'] == "Unknown"]))
+                 int(df_recent['match_winner'].isna().sum()))
+        st.metric("Rejected Rows at Ingest", len(rejected))
+        
+        if len(rejected) > 0:
+            with st.expander("Show rejected rows"):
+                st.dataframe(rejected)
 
 # Additional exact replicas of notebook analyses
 st.markdown("---")
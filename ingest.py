@@ -0,0 +1,88 @@
+import pandas as pd
+
+DATA_FILE = "ipl_matches_summary.csv"
+
+# Expected columns of the match summary CSV and the dtype each is normalized to
+SCHEMA = {
+    'match_id': 'Int64',
+    'season': 'Int64',
+    'city': 'string',
+    'date': 'datetime64[ns]',
+    'venue': 'string',
+    'team_1': 'string',
+    'team_2': 'string',
+    'toss_winner': 'string',
+    'toss_decision': 'string',
+    'match_winner': 'string',
+    'player_of_match': 'string',
+    'umpire_1': 'string',
+    'umpire_2': 'string',
+}
+
+# Columns every kept match must have a value for
+REQUIRED_COLUMNS = ['match_id', 'season', 'date', 'venue', 'team_1', 'team_2', 'toss_winner', 'toss_decision']
+
+TOSS_DECISIONS = ['bat', 'field']
+
+# Season labels are either a plain year ("2019") or a split season ("2007/08")
+SEASON_PATTERN = r'(\d{4})(?:/(\d{2}))?'
+
+# Split seasons normally map to the year they end in ("2007/08" -> 2008, "2009/10" -> 2010).
+# Exceptions are listed here with the year the season was actually played in.
+SEASON_LABEL_OVERRIDES = {
+    '2020/21': 2020,  # moved to the UAE and played September-November 2020
+}
+
+
+def load_matches(path=DATA_FILE):
+    # Read everything as text first so nothing is coerced silently
+    raw = pd.read_csv(path, dtype=str)
+
+    missing_columns = [col for col in SCHEMA if col not in raw.columns]
+    if missing_columns:
+        raise ValueError(f"{path} is missing columns: {', '.join(missing_columns)}")
+
+    df = pd.DataFrame(index=raw.index)
+    for col, dtype in SCHEMA.items():
+        if dtype == 'string':
+            df[col] = raw[col].astype('string').str.strip()
+
+    match_id = pd.to_numeric(raw['match_id'], errors='coerce')
+    df['match_id'] = match_id.where(match_id % 1 == 0).astype('Int64')
+    df['date'] = pd.to_datetime(raw['date'], format='%Y-%m-%d', errors='coerce')
+
+    # Canonical season is the integer year the season was played in
+    season_label = raw['season'].astype('string').str.strip()
+    label_parts = season_label.str.extract(f'^{SEASON_PATTERN}$')
+    start_year = pd.to_numeric(label_parts[0]).astype('Int64')
+    end_digits = pd.to_numeric(label_parts[1]).astype('Int64')
+    # A split label must end the year after it starts ("2007/08", but not "2007/09")
+    end_year = (start_year + 1).where((start_year + 1) % 100 == end_digits)
+    season = start_year.where(end_digits.isna(), end_year)
+    df['season'] = season_label.map(SEASON_LABEL_OVERRIDES).astype('Int64').fillna(season)
+
+    # Collect every reason a row fails validation
+    checks = [(raw[col].isna(), f"missing {col}") for col in REQUIRED_COLUMNS]
+    checks += [
+        (raw[col].notna() & df[col].isna(), f"invalid {name}")
+        for col, name in [('match_id', 'match_id'), ('season', 'season label'), ('date', 'date')]
+    ]
+    checks += [
+        (df['match_id'].duplicated() & df['match_id'].notna(), "duplicate match_id"),
+        (df['season'].notna() & df['date'].notna() & df['season'].ne(df['date'].dt.year).fillna(False),
+         "season label does not match date"),
+        (df['toss_decision'].notna() & ~df['toss_decision'].isin(TOSS_DECISIONS), "invalid toss_decision"),
+        (df['toss_winner'].notna() & ~df['toss_winner'].eq(df['team_1']).fillna(False)
+         & ~df['toss_winner'].eq(df['team_2']).fillna(False), "toss_winner not in match"),
+        (df['match_winner'].notna() & ~df['match_winner'].eq(df['team_1']).fillna(False)
+         & ~df['match_winner'].eq(df['team_2']).fillna(False), "match_winner not in match"),
+    ]
+    reasons = pd.Series("", index=raw.index)
+    for failed, reason in checks:
+        failed = failed.astype(bool)
+        reasons[failed] = reasons[failed] + reason + "; "
+
+    rejected = raw[reasons != ""].assign(reason=reasons[reasons != ""].str.rstrip("; "))
+    matches = df.loc[reasons == "", list(SCHEMA)].astype(SCHEMA).reset_index(drop=True)
+
+    return matches, rejected.reset_index(drop=True)
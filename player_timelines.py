@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+
+def infer_award_teams(timeline):
+    # Walk each player's awards in date order, intersecting the two sides of
+    # consecutive award matches. While the intersection is non-empty the player
+    # is on one team for the whole stretch; an empty intersection starts a new
+    # stretch (e.g. after a move between teams). A stretch that narrows down to
+    # a single side gives every award in it that team; otherwise it stays NA.
+    players = timeline['player_of_match'].to_numpy()
+    team_1 = timeline['team_1'].to_numpy()
+    team_2 = timeline['team_2'].to_numpy()
+    teams = np.full(len(timeline), pd.NA, dtype=object)
+
+    start, candidates = 0, set()
+    for i in range(len(timeline) + 1):
+        sides = {team_1[i], team_2[i]} if i < len(timeline) else set()
+        if i < len(timeline) and i > start and players[i] == players[i - 1] and candidates & sides:
+            candidates &= sides
+            continue
+        if len(candidates) == 1:
+            teams[start:i] = candidates.pop()
+        start, candidates = i, sides
+
+    return pd.Series(teams, index=timeline.index, dtype='string')
+
+
+# Build a date-sorted award timeline per player (one compact table + offsets)
+def build_player_timelines(data):
+    awards = data[data['player_of_match'].notna()]
+    timeline = awards.sort_values(['player_of_match', 'date'])[
+        ['player_of_match', 'match_id', 'date', 'season', 'team_1', 'team_2', 'match_winner']
+    ].reset_index(drop=True)
+
+    timeline['team'] = infer_award_teams(timeline)
+
+    # NA when the team is unknown or the match had no result
+    timeline['won'] = timeline['team'] == timeline['match_winner']
+
+    # Offset index: each player's awards are the contiguous rows [start, end)
+    players = timeline['player_of_match']
+    starts = np.flatnonzero(players.ne(players.shift()).to_numpy(dtype=bool, na_value=True))
+    ends = np.append(starts[1:], len(timeline))
+    offsets = {player: (int(start), int(end)) for player, start, end in zip(players.iloc[starts], starts, ends)}
+
+    # Rank of every player by number of awards within each season
+    season_awards = timeline.groupby(['season', 'player_of_match']).size().rename('awards').reset_index()
+    season_awards['rank'] = season_awards.groupby('season')['awards'].rank(ascending=False, method='min').astype(int)
+
+    return {'timeline': timeline, 'offsets': offsets, 'season_ranks': season_awards}
+
+
+def get_player_timeline(timelines, player):
+    start, end = timelines['offsets'].get(player, (0, 0))
+    return timelines['timeline'].iloc[start:end]
+
+
+def summarize_player_timeline(player_timeline):
+    # Run-length encode consecutive awards for the same team into stints; awards
+    # whose team could not be inferred form their own "Unknown" runs
+    teams = player_timeline['team'].fillna("Unknown")
+    team_runs = teams.ne(teams.shift()).to_numpy(dtype=bool, na_value=True).cumsum()
+    stints = player_timeline.assign(team=teams).groupby(team_runs).agg(
+        team=('team', 'first'),
+        first_season=('season', 'first'),
+        last_season=('season', 'last'),
+        awards=('match_id', 'size'),
+    ).reset_index(drop=True)
+
+    gaps = player_timeline['date'].diff().dt.days
+    return {
+        'stints': stints,
+        'longest_gap_days': int(gaps.max()) if gaps.notna().any() else 0,
+        'awards_in_wins': int(player_timeline['won'].eq(True).sum()),
+        'awards_in_losses': int(player_timeline['won'].eq(False).sum()),
+        'awards_unresolved': int(player_timeline['won'].isna().sum()),
+    }
@@ -0,0 +1,54 @@
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from api import APIRequestHandler
+
+
+@pytest.fixture
+def client():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), APIRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def get(path, headers=None):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        return response, body
+
+    yield get
+    server.shutdown()
+    server.server_close()
+
+
+def test_ok_response_has_etag(client):
+    response, body = client("/top-players?limit=3")
+    assert response.status == 200
+    assert response.getheader("ETag")
+    assert len(json.loads(body)) == 3
+
+
+def test_matching_etag_returns_not_modified(client):
+    response, _ = client("/venues")
+    etag = response.getheader("ETag")
+    response, body = client("/venues", headers={"If-None-Match": etag})
+    assert response.status == 304
+    assert body == b""
+
+
+@pytest.mark.parametrize("path", ["/team", "/top-players?limit=0", "/venues?limit=-1", "/seasons?start=x"])
+def test_bad_parameters_return_bad_request(client, path):
+    response, body = client(path)
+    assert response.status == 400
+    assert "error" in json.loads(body)
+
+
+def test_unknown_path_returns_not_found(client):
+    response, _ = client("/nope")
+    assert response.status == 404